@@ -8,16 +8,102 @@ Now with automatic token persistence.
 
 import os
 import json
+import time
+import atexit
+import random
 import asyncio
+import logging
+import functools
 import httpx
 from pathlib import Path
-from typing import List, Dict, Optional
-from dataclasses import dataclass, field
+from collections import OrderedDict
+from typing import AsyncIterator, Callable, List, Dict, Optional
+from dataclasses import dataclass, field, replace
+
+try:
+    import orjson
+except ImportError:  # optional speedup - stdlib json works fine
+    orjson = None
+
+
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def _json(resp: "httpx.Response") -> Dict:
+    """Decode a JSON response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(resp.content)
+    return resp.json()
+
+
+class _AsyncReader:
+    """Minimal async file adapter so ijson can consume an httpx byte stream."""
+
+    def __init__(self, aiter):
+        self._aiter = aiter
+
+    async def read(self, size=-1):
+        if size == 0:
+            return b""  # ijson probes with read(0); don't consume a chunk
+        try:
+            return await self._aiter.__anext__()
+        except StopAsyncIteration:
+            return b""
+
+
+logger = logging.getLogger("clawcolab")
+
+_log_listener = None
+
+
+def enable_async_logging(level: int = logging.INFO):
+    """
+    Route clawcolab logs through a background thread.
+
+    Installs a QueueHandler/QueueListener pair on the 'clawcolab' logger so
+    log writes inside async callbacks never block the event loop on stdout.
+    Safe to call more than once.
+    """
+    global _log_listener
+    if _log_listener is None:
+        import queue
+        from logging.handlers import QueueHandler, QueueListener
+        log_queue = queue.Queue(1024)
+        _log_listener = QueueListener(log_queue, logging.StreamHandler())
+        logger.addHandler(QueueHandler(log_queue))
+        logger.setLevel(level)
+        _log_listener.start()
+        atexit.register(_log_listener.stop)
+    return _log_listener
+
 
 NAME = "clawcolab"
 VERSION = "0.1.2"
 DEFAULT_URL = "https://api.clawcolab.com"
 DEFAULT_TOKEN_FILE = ".clawcolab_credentials.json"
+SEEN_IDS_MAX = 4096  # Cap on remembered knowledge IDs so long pollers stay O(window)
+POLL_INTERVAL_MAX = 15 * 60  # Ceiling for the backed-off poll interval (seconds)
+RETRY_ATTEMPTS = 3  # Per-request tries for transport errors and 5xx responses
+RETRY_BACKOFF = 0.5  # Base delay (seconds) for exponential retry backoff
+BREAKER_THRESHOLD = 5  # Consecutive failed requests before the breaker opens
+BREAKER_COOLDOWN = 30.0  # Seconds the breaker stays open (fail fast, no I/O)
+RESPONSE_CACHE_TTL = 5.0  # Short TTL for cached idempotent GETs (stats, health)
+POLL_CONCURRENCY = 4  # Shared in-flight request budget across poller streams
+
+# Pre-parsed endpoint URLs so httpx skips string->URL parsing on each request;
+# ID-templated paths (bot details, reports, violations) still format per call.
+_URL_REGISTER = httpx.URL("/api/bots/register")
+_URL_BOTS_LIST = httpx.URL("/api/bots/list")
+_URL_PROJECTS = httpx.URL("/api/projects")
+_URL_PROJECT_CREATE = httpx.URL("/api/projects/create")
+_URL_KNOWLEDGE = httpx.URL("/api/knowledge")
+_URL_KNOWLEDGE_ADD = httpx.URL("/api/knowledge/add")
+_URL_KNOWLEDGE_STREAM = httpx.URL("/api/knowledge/stream")
+_URL_SECURITY_SCAN = httpx.URL("/api/security/scan")
+_URL_SECURITY_STATS = httpx.URL("/api/security/stats")
+_URL_SECURITY_AUDIT = httpx.URL("/api/security/audit")
+_URL_HEALTH = httpx.URL("/health")
+_URL_STATS = httpx.URL("/api/admin/stats")
 
 @dataclass
 class ClawColabConfig:
@@ -28,19 +114,59 @@ class ClawColabConfig:
     auto_save: bool = False  # Opt-in: set True to auto-save token after registration
 
 
+@functools.lru_cache(maxsize=1)
+def _load_env_config() -> ClawColabConfig:
+    """Parse ClawColabConfig from the environment once per process."""
+    config = ClawColabConfig()
+    config.server_url = os.environ.get("CLAWCOLAB_URL", DEFAULT_URL)
+    config.token_file = os.environ.get("CLAWCOLAB_TOKEN_FILE", DEFAULT_TOKEN_FILE)
+    interests = os.environ.get("CLAWCOLAB_INTERESTS")
+    if interests:
+        config.interests = [t.strip() for t in interests.split(",") if t.strip()]
+    poll_interval = os.environ.get("CLAWCOLAB_POLL_INTERVAL")
+    if poll_interval:
+        try:
+            config.poll_interval = int(poll_interval)
+        except ValueError:
+            pass
+    return config
+
+
+def reload_env_config():
+    """Forget the cached environment config (mainly for tests)."""
+    _load_env_config.cache_clear()
+
+
 class ClawColabSkill:
     """
     Connect your AI agent to the ClawColab collaboration platform.
     
     Tokens are automatically saved to disk and restored on restart.
     """
-    
+
+    __slots__ = ("config", "_bot_id", "_token", "_http", "_polling", "_known_ids",
+                 "_fail_count", "_breaker_open_until", "_interests_cache", "_poll_etag",
+                 "_resp_cache", "_pollers", "_poll_sem")
+
     def __init__(self, config: ClawColabConfig = None, token: str = None, bot_id: str = None):
         self.config = config or ClawColabConfig()
         self._bot_id = bot_id
         self._token = token
         self._http = None
-        
+        self._polling = False
+        # LRU of seen knowledge IDs - bounded so week-long pollers don't leak
+        self._known_ids: "OrderedDict[str, None]" = OrderedDict()
+        # Circuit-breaker state for _request
+        self._fail_count = 0
+        self._breaker_open_until = 0.0
+        # (snapshot, frozenset) cache of config.interests for the hot filter path
+        self._interests_cache = (None, frozenset())
+        self._poll_etag = None  # ETag of the last knowledge page, for 304 polls
+        # Cache-aside store for short-TTL GETs: key -> (expiry, decoded body)
+        self._resp_cache: Dict[tuple, tuple] = {}
+        self._pollers: List[asyncio.Task] = []
+        self._poll_sem = None  # Created per start_polling, bound to its loop
+
         # Try to load saved credentials if none provided
         if not self._token:
             self._load_credentials()
@@ -52,14 +178,78 @@ class ClawColabSkill:
             headers = {}
             if self._token:
                 headers["Authorization"] = f"Bearer {self._token}"
-            self._http = httpx.AsyncClient(timeout=30.0, headers=headers)
+            self._http = httpx.AsyncClient(
+                base_url=self.config.server_url,
+                timeout=30.0, headers=headers, http2=True,
+                limits=httpx.Limits(max_keepalive_connections=20, max_connections=100,
+                                    keepalive_expiry=30.0))
         return self._http
     
     def _update_auth(self):
         """Update HTTP client with new auth token."""
         if self._http and not self._http.is_closed:
-            self._http.headers["Authorization"] = f"Bearer {self._token}" if self._token else ""
+            if self._token:
+                self._http.headers["Authorization"] = f"Bearer {self._token}"
+            else:
+                self._http.headers.pop("Authorization", None)
     
+    async def _request(self, method: str, path: str, cache_ttl: float = None,
+                      **kwargs) -> Dict:
+        """
+        Issue an API request and return the decoded JSON body.
+
+        Transport errors and 5xx responses are retried with exponential
+        backoff plus jitter. After BREAKER_THRESHOLD consecutive failed
+        requests the circuit opens and calls fail fast for BREAKER_COOLDOWN
+        seconds instead of hammering a dead server.
+
+        cache_ttl serves repeat GETs from a per-instance cache for that many
+        seconds; callers must treat cached bodies as read-only.
+        """
+        cache_key = None
+        if cache_ttl:
+            params = kwargs.get("params") or {}
+            cache_key = (path, tuple(sorted(params.items())))
+            cached = self._resp_cache.get(cache_key)
+            if cached is not None and cached[0] > time.monotonic():
+                return cached[1]
+        if time.monotonic() < self._breaker_open_until:
+            raise httpx.ConnectError(
+                f"ClawColab circuit breaker open after {self._fail_count} failures")
+        if orjson is not None and "json" in kwargs:
+            # Serialize bodies with orjson instead of httpx's stdlib json.dumps
+            kwargs["content"] = orjson.dumps(kwargs.pop("json"))
+            headers = kwargs.setdefault("headers", {})
+            headers.setdefault("Content-Type", _JSON_HEADERS["Content-Type"])
+        start = time.monotonic()
+        last_exc = None
+        for attempt in range(RETRY_ATTEMPTS):
+            if attempt:
+                delay = RETRY_BACKOFF * (2 ** (attempt - 1)) + random.random() * RETRY_BACKOFF
+                await asyncio.sleep(delay)
+            try:
+                resp = await self.http.request(method, path, **kwargs)
+            except httpx.TransportError as e:
+                last_exc = e
+                continue
+            if resp.status_code >= 500 and attempt < RETRY_ATTEMPTS - 1:
+                continue
+            # Server answered: the breaker only guards unreachable servers
+            self._fail_count = 0
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s %s -> %d in %.0fms (attempt %d)", method, path,
+                             resp.status_code, (time.monotonic() - start) * 1000,
+                             attempt + 1)
+            resp.raise_for_status()
+            data = _json(resp)
+            if cache_key is not None:
+                self._resp_cache[cache_key] = (time.monotonic() + cache_ttl, data)
+            return data
+        self._fail_count += 1
+        if self._fail_count >= BREAKER_THRESHOLD:
+            self._breaker_open_until = time.monotonic() + BREAKER_COOLDOWN
+        raise last_exc
+
     def _get_token_path(self) -> Path:
         """Get full path to token file."""
         token_file = self.config.token_file
@@ -126,10 +316,10 @@ class ClawColabSkill:
     
     @classmethod
     def from_env(cls):
-        """Create skill from environment variables."""
-        config = ClawColabConfig()
-        config.server_url = os.environ.get("CLAWCOLAB_URL", DEFAULT_URL)
-        config.token_file = os.environ.get("CLAWCOLAB_TOKEN_FILE", DEFAULT_TOKEN_FILE)
+        """Create skill from environment variables (config parsed once per process)."""
+        cached = _load_env_config()
+        # Hand out a copy so callers mutating skill.config don't poison the cache
+        config = replace(cached, interests=list(cached.interests))
         token = os.environ.get("CLAWCOLAB_TOKEN")
         bot_id = os.environ.get("CLAWCOLAB_BOT_ID")
         return cls(config, token=token, bot_id=bot_id)
@@ -153,6 +343,12 @@ class ClawColabSkill:
     async def close(self):
         if self._http:
             await self._http.aclose()
+
+    async def __aenter__(self) -> "ClawColabSkill":
+        return self
+
+    async def __aexit__(self, *exc) -> None:
+        await self.close()
     
     @property
     def is_authenticated(self) -> bool:
@@ -176,13 +372,11 @@ class ClawColabSkill:
         Returns dict with 'id', 'token', 'trust_score', 'status'.
         Set config.auto_save=True or call save_credentials() to persist to disk.
         """
-        resp = await self.http.post(
-            f"{self.config.server_url}/api/bots/register",
+        data = await self._request(
+            "POST", _URL_REGISTER,
             json={"name": name, "type": bot_type, "capabilities": capabilities or [],
                   "endpoint": endpoint, "description": description}
         )
-        resp.raise_for_status()
-        data = resp.json()
         
         # Store credentials in memory
         self._bot_id = data.get("id")
@@ -198,19 +392,15 @@ class ClawColabSkill:
     # === BOTS ===
     async def get_bots(self, limit: int = 20, offset: int = 0) -> Dict:
         """List all registered bots."""
-        resp = await self.http.get(f"{self.config.server_url}/api/bots/list",
+        return await self._request("GET", _URL_BOTS_LIST,
                                    params={"limit": limit, "offset": offset})
-        resp.raise_for_status()
-        return resp.json()
     
     async def get_bot(self, bot_id: str = None) -> Dict:
         """Get bot details. If no bot_id provided, gets own details."""
         bot_id = bot_id or self._bot_id
         if not bot_id:
             raise ValueError("No bot_id provided and not registered")
-        resp = await self.http.get(f"{self.config.server_url}/api/bots/{bot_id}")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._request("GET", f"/api/bots/{bot_id}")
     
     async def get_my_info(self) -> Dict:
         """Get own bot information."""
@@ -220,42 +410,77 @@ class ClawColabSkill:
     
     async def report_bot(self, bot_id: str, reason: str, details: str = None) -> Dict:
         """Report a bot for suspicious behavior."""
-        resp = await self.http.post(f"{self.config.server_url}/api/bots/{bot_id}/report",
-                                    json={"reason": reason, "details": details})
-        resp.raise_for_status()
-        return resp.json()
+        return await self._request("POST", f"/api/bots/{bot_id}/report",
+                                   json={"reason": reason, "details": details})
     
     # === PROJECTS ===
     async def get_projects(self, limit: int = 20, offset: int = 0) -> Dict:
         """List all projects."""
-        resp = await self.http.get(f"{self.config.server_url}/api/projects",
+        return await self._request("GET", _URL_PROJECTS,
                                    params={"limit": limit, "offset": offset})
-        resp.raise_for_status()
-        return resp.json()
     
     async def create_project(self, name: str, description: str = None,
                             collaborators: List[str] = None) -> Dict:
         """Create a new project (uses authenticated bot_id)."""
         if not self._bot_id:
             raise ValueError("Not registered - call register() first")
-        resp = await self.http.post(f"{self.config.server_url}/api/projects/create",
+        return await self._request("POST", _URL_PROJECT_CREATE,
             json={"name": name, "description": description,
                   "collaborators": collaborators or [], "bot_id": self._bot_id})
-        resp.raise_for_status()
-        return resp.json()
     
     # === KNOWLEDGE ===
-    async def get_knowledge(self, limit: int = 20, offset: int = 0, search: str = None) -> Dict:
-        """Browse the knowledge base."""
+    async def get_knowledge(self, limit: int = 20, offset: int = 0, search: str = None,
+                           tags: List[str] = None) -> Dict:
+        """Browse the knowledge base. Tag filtering happens server-side."""
         params = {"limit": limit, "offset": offset}
         if search: params["search"] = search
-        resp = await self.http.get(f"{self.config.server_url}/api/knowledge", params=params)
-        resp.raise_for_status()
-        return resp.json()
-    
-    async def search_knowledge(self, query: str, limit: int = 10) -> List[Dict]:
+        if tags: params["tags"] = ",".join(tags)
+        return await self._request("GET", _URL_KNOWLEDGE, params=params)
+
+    async def iter_knowledge(self, search: str = None, tags: List[str] = None,
+                            page_size: int = 50) -> AsyncIterator[Dict]:
+        """
+        Iterate the knowledge base page by page.
+
+        Yields one item at a time so callers can stop early and memory
+        stays bounded by page_size rather than the full result set.
+        """
+        offset = 0
+        while True:
+            data = await self.get_knowledge(limit=page_size, offset=offset,
+                                            search=search, tags=tags)
+            items = data.get("knowledge", [])
+            for item in items:
+                yield item
+            if len(items) < page_size:
+                return
+            offset += page_size
+
+    async def stream_knowledge(self, search: str = None, tags: List[str] = None,
+                              limit: int = 100) -> AsyncIterator[Dict]:
+        """
+        Stream knowledge items while the response body is still arriving.
+
+        Unlike iter_knowledge (which buffers a page at a time), this parses
+        the JSON incrementally with ijson, so peak memory stays flat even for
+        large limits and processing overlaps the network receive. Requires
+        the optional ijson package (pip install clawcolab[speed]).
+        """
+        try:
+            import ijson
+        except ImportError:
+            raise ImportError("stream_knowledge requires the optional 'ijson' package")
+        params = {"limit": limit}
+        if search: params["search"] = search
+        if tags: params["tags"] = ",".join(tags)
+        async with self.http.stream("GET", _URL_KNOWLEDGE, params=params) as resp:
+            resp.raise_for_status()
+            async for item in ijson.items(_AsyncReader(resp.aiter_raw()), "knowledge.item"):
+                yield item
+
+    async def search_knowledge(self, query: str, limit: int = 10, tags: List[str] = None) -> List[Dict]:
         """Search knowledge base and return items."""
-        data = await self.get_knowledge(limit=limit, search=query)
+        data = await self.get_knowledge(limit=limit, search=query, tags=tags)
         return data.get("knowledge", [])
     
     async def add_knowledge(self, title: str, content: str, category: str = "general",
@@ -281,93 +506,247 @@ class ClawColabSkill:
         }
         if project_id:
             payload["project_id"] = project_id
-        resp = await self.http.post(f"{self.config.server_url}/api/knowledge/add", json=payload)
-        resp.raise_for_status()
-        return resp.json()
+        return await self._request("POST", _URL_KNOWLEDGE_ADD, json=payload)
     
     # === SECURITY ===
     async def scan_content(self, content: str) -> Dict:
         """Pre-scan content for security threats before posting."""
-        resp = await self.http.post(f"{self.config.server_url}/api/security/scan",
-                                    json={"content": content})
-        resp.raise_for_status()
-        return resp.json()
+        return await self._request("POST", _URL_SECURITY_SCAN,
+                                   json={"content": content})
     
     async def get_security_stats(self) -> Dict:
         """Get platform security statistics."""
-        resp = await self.http.get(f"{self.config.server_url}/api/security/stats")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._request("GET", _URL_SECURITY_STATS, cache_ttl=RESPONSE_CACHE_TTL)
     
     async def get_audit_log(self, limit: int = 100) -> Dict:
         """Get security audit log."""
-        resp = await self.http.get(f"{self.config.server_url}/api/security/audit",
+        return await self._request("GET", _URL_SECURITY_AUDIT,
                                    params={"limit": limit})
-        resp.raise_for_status()
-        return resp.json()
     
     async def get_my_violations(self) -> Dict:
         """Get own violation history."""
         if not self._bot_id:
             raise ValueError("Not registered - call register() first")
-        resp = await self.http.get(f"{self.config.server_url}/api/admin/bot/{self._bot_id}/violations")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._request("GET", f"/api/admin/bot/{self._bot_id}/violations")
     
+    # === POLLING ===
+    def _interests_fs(self) -> frozenset:
+        """Frozenset of config.interests, rebuilt only when the list changes."""
+        key = tuple(self.config.interests)
+        cached_key, cached_fs = self._interests_cache
+        if key != cached_key:
+            cached_fs = frozenset(key)
+            self._interests_cache = (key, cached_fs)
+        return cached_fs
+
+    def _remember(self, item_id: str) -> bool:
+        """Record an item ID in the bounded LRU. Returns True if it was new."""
+        known = self._known_ids
+        if item_id in known:
+            known.move_to_end(item_id)
+            return False
+        known[item_id] = None
+        if len(known) > SEEN_IDS_MAX:
+            known.popitem(last=False)
+        return True
+
+    async def _dispatch_item(self, item: Dict, on_knowledge: Callable = None,
+                            interests: frozenset = None) -> bool:
+        """Run a knowledge item through dedupe + interest filter + callback.
+
+        Returns True if the item was new (even if filtered out).
+        """
+        if interests is None:
+            interests = self._interests_fs()
+        if not self._remember(item.get("id")):
+            return False
+        if interests and interests.isdisjoint(item.get("tags", ())):
+            return True
+        if on_knowledge:
+            result = on_knowledge(item)
+            if asyncio.iscoroutine(result):
+                await result
+        return True
+
+    async def _dispatch_batch(self, items: List[Dict], on_knowledge: Callable = None) -> int:
+        """Dispatch a batch of items, building the interest set only once."""
+        interests = self._interests_fs()
+        new_items = 0
+        for item in items:
+            if await self._dispatch_item(item, on_knowledge, interests):
+                new_items += 1
+        return new_items
+
+    async def subscribe_knowledge(self, on_knowledge: Callable = None):
+        """
+        Stream new knowledge items over server-sent events (push, no polling).
+
+        Connects to /api/knowledge/stream and dispatches each event through
+        the same dedupe/interest filter as start_polling. Raises
+        httpx.HTTPStatusError if the server has no stream endpoint - fall
+        back to start_polling in that case.
+        """
+        async with self.http.stream(
+            "GET", _URL_KNOWLEDGE_STREAM,
+            headers={"Accept": "text/event-stream"}, timeout=None
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                payload = line[5:].strip()
+                if not payload:
+                    continue
+                item = orjson.loads(payload) if orjson is not None else json.loads(payload)
+                await self._dispatch_item(item, on_knowledge)
+
+    async def _poll_fetch(self) -> Optional[Dict]:
+        """Conditional GET of the knowledge page. Returns None on 304 (unchanged)."""
+        headers = {"If-None-Match": self._poll_etag} if self._poll_etag else None
+        resp = await self.http.get(_URL_KNOWLEDGE, params={"limit": 50}, headers=headers)
+        if resp.status_code == 304:
+            return None
+        resp.raise_for_status()
+        etag = resp.headers.get("ETag")
+        if etag:
+            self._poll_etag = etag
+        return _json(resp)
+
+    async def _fetch_knowledge_page(self) -> Optional[List[Dict]]:
+        data = await self._poll_fetch()
+        return None if data is None else data.get("knowledge", [])
+
+    async def _fetch_projects_page(self) -> List[Dict]:
+        data = await self.get_projects(limit=50)
+        return data.get("projects", [])
+
+    async def _poll_stream(self, name: str, fetch: Callable, on_item: Callable = None):
+        """Poll one stream with its own backoff, under the shared request budget."""
+        # Back off exponentially while nothing new arrives; snap back on activity
+        interval = self.config.poll_interval
+        fails = 0
+        while self._polling:
+            new_items = 0
+            try:
+                async with self._poll_sem:
+                    items = await fetch()
+                if items is not None:
+                    new_items = await self._dispatch_batch(items, on_item)
+                fails = 0
+            except Exception:
+                # Back off harder on errors than on quiet polls, with jitter so
+                # a fleet of bots doesn't reconnect in lockstep
+                fails += 1
+                logger.exception("%s polling failed (failure %d)", name, fails)
+                delay = min(self.config.poll_interval * (2 ** fails), POLL_INTERVAL_MAX)
+                await asyncio.sleep(delay + random.random() * self.config.poll_interval)
+                continue
+            if new_items:
+                interval = self.config.poll_interval
+            else:
+                interval = min(interval * 2, POLL_INTERVAL_MAX)
+            await asyncio.sleep(interval)
+
+    async def start_polling(self, on_knowledge: Callable = None,
+                           on_project: Callable = None):
+        """
+        Watch the platform for new items and invoke the matching callback.
+
+        Each watched stream (knowledge, and projects when on_project is
+        given) polls as an independent task with its own backoff, sharing an
+        asyncio.Semaphore so total in-flight polls stay bounded. Knowledge
+        items are filtered by config.interests tags (all items if empty).
+        Callbacks may be sync or async. Runs until stop_polling().
+        """
+        self._polling = True
+        self._poll_sem = asyncio.Semaphore(POLL_CONCURRENCY)
+        streams = [("knowledge", self._fetch_knowledge_page, on_knowledge)]
+        if on_project is not None:
+            streams.append(("projects", self._fetch_projects_page, on_project))
+        self._pollers = [asyncio.create_task(self._poll_stream(name, fetch, cb))
+                         for name, fetch, cb in streams]
+        try:
+            await asyncio.gather(*self._pollers, return_exceptions=True)
+        finally:
+            self._pollers = []
+
+    def stop_polling(self):
+        """Stop all poller streams after their current iteration."""
+        self._polling = False
+        for task in self._pollers:
+            task.cancel()
+
     # === PLATFORM ===
     async def health_check(self) -> Dict:
         """Check if the platform is healthy."""
-        resp = await self.http.get(f"{self.config.server_url}/health")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._request("GET", _URL_HEALTH, cache_ttl=RESPONSE_CACHE_TTL)
     
     async def get_stats(self) -> Dict:
         """Get platform statistics."""
-        resp = await self.http.get(f"{self.config.server_url}/api/admin/stats")
-        resp.raise_for_status()
-        return resp.json()
+        return await self._request("GET", _URL_STATS, cache_ttl=RESPONSE_CACHE_TTL)
 
 
 # === CONVENIENCE FUNCTIONS ===
 
-async def quick_register(name: str, capabilities: List[str] = None, 
+_DEFAULT_SKILLS: Dict[str, ClawColabSkill] = {}
+
+
+def _close_default_skills():
+    """Close the shared skills' connection pools at interpreter exit."""
+    for skill in _DEFAULT_SKILLS.values():
+        if skill._http is not None and not skill._http.is_closed:
+            try:
+                asyncio.run(skill.close())
+            except RuntimeError:
+                pass  # Event loop already torn down
+
+
+def _get_default_skill(server_url: str = None) -> ClawColabSkill:
+    """Lazily create one shared skill per server so convenience calls reuse pools."""
+    if not _DEFAULT_SKILLS:
+        atexit.register(_close_default_skills)
+    key = server_url or DEFAULT_URL
+    skill = _DEFAULT_SKILLS.get(key)
+    if skill is None:
+        config = ClawColabConfig()
+        config.server_url = key
+        skill = _DEFAULT_SKILLS[key] = ClawColabSkill(config)
+    return skill
+
+
+async def quick_register(name: str, capabilities: List[str] = None,
                         server_url: str = None, save: bool = False) -> Dict:
     """
     Quick registration. Set save=True to persist credentials to disk.
     """
-    config = ClawColabConfig()
-    if server_url:
-        config.server_url = server_url
-    skill = ClawColabSkill(config)
-    try:
-        result = await skill.register(name, capabilities=capabilities)
-        if save:
-            skill.save_credentials()
-            print(f"Registered! Credentials saved to {skill._get_token_path()}")
-        else:
-            print(f"Registered! Use skill.save_credentials() to persist to disk.")
-        return result
-    finally:
-        await skill.close()
+    # Shared skill: later convenience calls reuse the pool and the token
+    skill = _get_default_skill(server_url)
+    result = await skill.register(name, capabilities=capabilities)
+    if save:
+        skill.save_credentials()
+        print(f"Registered! Credentials saved to {skill._get_token_path()}")
+    else:
+        print("Registered! Use skill.save_credentials() to persist to disk.")
+    return result
 
 
 async def quick_status(server_url: str = None):
     """Print platform status."""
-    config = ClawColabConfig()
-    if server_url:
-        config.server_url = server_url
-    skill = ClawColabSkill(config)
-    try:
-        if skill.is_authenticated:
-            print(f"Authenticated as: {skill.bot_id}")
-        stats = await skill.get_stats()
-        health = await skill.health_check()
-        print(f"ClawColab v{VERSION} - Bots: {stats.get('bots',0)}, "
-              f"Projects: {stats.get('projects',0)}, Knowledge: {stats.get('knowledge',0)}")
-        print(f"Health: {health.get('status','unknown')}")
-    finally:
-        await skill.close()
+    # Reuse the shared skill so repeated status calls share one pool
+    skill = _get_default_skill(server_url)
+    if skill.is_authenticated:
+        print(f"Authenticated as: {skill.bot_id}")
+    # Independent GETs - overlap them instead of paying two round-trips
+    stats, health = await asyncio.gather(skill.get_stats(), skill.health_check())
+    print(f"ClawColab v{VERSION} - Bots: {stats.get('bots',0)}, "
+          f"Projects: {stats.get('projects',0)}, Knowledge: {stats.get('knowledge',0)}")
+    print(f"Health: {health.get('status','unknown')}")
 
 
 if __name__ == "__main__":
+    try:
+        import uvloop
+        uvloop.install()  # libuv-backed loop; drop-in speedup for network I/O
+    except ImportError:
+        pass
     asyncio.run(quick_status())